@@ -17,531 +17,153 @@ import os
 import sys
 import subprocess
 import shutil
-import stat
-import platform
-import re
-
-# ANSI color codes for output formatting
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-BLUE = "\033[94m"
-RED = "\033[91m"
-BOLD = "\033[1m"
-RESET = "\033[0m"
-
-# The sgit script content (copied from the sgit script)
-SGIT_SCRIPT = '''#!/usr/bin/env python3
-"""
-sgit - Semantic Versioning Git Pusher
-
-A custom Git wrapper that manages semantic versioning (2.0) with your Git repositories.
-Automatically tracks version numbers and provides a streamlined Git workflow.
-
-Usage:
-    sgit          - Regular commit with no version increment
-    sgit -M       - Increment major version (resets minor and patch to 00)
-    sgit -m       - Increment minor version (resets patch to 00)
-    sgit -p       - Increment patch version
-    sgit -s X.Y.Z - Set version to specific value (e.g., sgit -s 01.02.03)
-
-Features:
-    - Semantic versioning integration with Git commits
-    - File selection/deselection before committing
-    - Automatic version tracking
-    - Default timestamped commit messages
-"""
-
-import os
-import sys
-import subprocess
-import time
-import re
+import mmap
+import hashlib
 import argparse
-from datetime import datetime
-
-VERSION_FILE = "sgit.version"
-DEFAULT_VERSION = "00.00.01"  # Start with 00.00.01 if no version file exists
 
-def run_command(command, capture_output=True):
-    """Run a shell command and return its output."""
-    try:
-        result = subprocess.run(command, shell=True, check=True, 
-                               text=True, capture_output=capture_output)
-        return result.stdout.strip() if capture_output else None
-    except subprocess.CalledProcessError as e:
-        print(f"\\033[91mError executing: {command}\\033[0m")
-        print(f"\\033[91m{e.stderr}\\033[0m")
-        sys.exit(1)
-
-def get_git_root():
-    """Get the root directory of the Git repository."""
-    try:
-        return run_command("git rev-parse --show-toplevel")
-    except:
-        print("\\033[91mError: Not in a Git repository.\\033[0m")
-        sys.exit(1)
-
-def get_current_version():
-    """Get the current version from the sgit.version file."""
-    git_root = get_git_root()
-    version_path = os.path.join(git_root, VERSION_FILE)
-    
-    if os.path.exists(version_path):
-        with open(version_path, 'r') as f:
-            version = f.read().strip()
-            # Validate the version format
-            if re.match(r'^\\d{2}\\.\\d{2}\\.\\d{2}
-
-def main():
-    parser = argparse.ArgumentParser(description="Semantic Versioning Git Helper")
-    parser.add_argument('-M', action='store_true', help='Increment major version')
-    parser.add_argument('-m', action='store_true', help='Increment minor version')
-    parser.add_argument('-p', action='store_true', help='Increment patch version')
-    parser.add_argument('-s', metavar='VERSION', help='Set specific version (XX.XX.XX)')
-    
-    args = parser.parse_args()
-    
-    # Handle setting specific version with sgit -s
-    if args.s:
-        set_version(args.s)
-        return
-    
-    # Get current version
-    current_version = get_current_version()
-    
-    # Handle version increments
-    incremented = []
-    if args.M or args.m or args.p:
-        new_version, incremented = increment_version(current_version, args.M, args.m, args.p)
-        set_version(new_version)
-        current_version = new_version
-    
-    # Get changed files
-    changed_files = get_changed_files()
-    
-    # Show files to be committed
-    print("\\n\\033[1mFiles to be committed:\\033[0m")
-    for i, (filename, status_text, _) in enumerate(changed_files, 1):
-        print(f"{i}. {status_text} {filename}")
-    
-    # Ask if user wants to remove any files
-    print("\\nEnter indices of files to exclude (comma-separated) or press Enter to include all:")
-    exclude_input = input("> ").strip()
-    
-    # Create a list for files to add
-    files_to_add = []
-    
-    if exclude_input:
-        # Parse the indices to exclude
-        try:
-            exclude_indices = [int(idx.strip()) for idx in exclude_input.split(',') if idx.strip().isdigit()]
-            # Only include files not in the exclude list
-            files_to_add = [file[0] for i, file in enumerate(changed_files, 1) if i not in exclude_indices]
-        except ValueError:
-            print("\\033[93mInvalid input. Including all files.\\033[0m")
-            files_to_add = [file[0] for file in changed_files]
-        
-        if not files_to_add:
-            print("\\033[93mNo files selected for commit. Exiting.\\033[0m")
-            sys.exit(0)
-    else:
-        # Include all files if no exclusion
-        files_to_add = [file[0] for file in changed_files]
-    
-    # Display the list of files that will be added
-    print("\\n\\033[1mFiles that will be added to commit:\\033[0m")
-    for i, filename in enumerate(files_to_add, 1):
-        print(f"{i}. {filename}")
-    
-    # Add files to staging
-    if files_to_add:
-        # First reset any staged files
-        run_command("git reset", capture_output=False)
-        
-        # Use different approaches to handle file adding
-        try:
-            # Method 1: Use git add . and then remove files we don't want
-            run_command("git add .", capture_output=False)
-            
-            # If we're not adding all files, we need to remove some
-            all_files = [file[0] for file in changed_files]
-            files_to_remove = [file for file in all_files if file not in files_to_add]
-            
-            # Remove any files that should be excluded
-            for file in files_to_remove:
-                print(f"\\033[94mExcluding: {file}\\033[0m")
-                run_command(f"git reset HEAD \\"{file}\\"", capture_output=False)
-                
-            print(f"\\n\\033[92mAdded {len(files_to_add)} file(s) to commit\\033[0m")
-        except Exception as e:
-            print(f"\\033[91mError adding files: {str(e)}\\033[0m")
-            sys.exit(1)
-    
-    # Get commit message
-    print("\\nEnter commit message (press Enter for timestamp):")
-    commit_message = input("> ").strip()
-    
-    if not commit_message:
-        # Use Unix timestamp as default message
-        commit_message = f"Automatic commit at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    
-    # Format version with stars for the commit
-    version_display = format_version_with_stars(current_version, incremented)
-    
-    # Create full commit message with version
-    full_commit_message = f"[{version_display}] {commit_message}"
-    
-    # Commit and push
-    print(f"\\n\\033[94mCommitting with message: \\"{full_commit_message}\\"\\033[0m")
-    run_command(f"git commit -m \\"{full_commit_message}\\"", capture_output=False)
-    
-    print("\\n\\033[94mPushing to remote repository...\\033[0m")
-    push_result = run_command("git push", capture_output=True)
-    
-    print(f"\\n\\033[92mSuccessfully pushed with version {current_version}\\033[0m")
-
-if __name__ == "__main__":
-    main()
-"""
+# ANSI color codes for output formatting, left empty when output is not a
+# terminal so pipes and logs get plain text
+if sys.stdout.isatty():
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    BLUE = "\033[94m"
+    RED = "\033[91m"
+    BOLD = "\033[1m"
+    RESET = "\033[0m"
+else:
+    GREEN = YELLOW = BLUE = RED = BOLD = RESET = ""
+
+# Directories on PATH, split once for exact membership checks
+_PATH_ENTRIES = frozenset(filter(None, os.environ.get("PATH", "").split(os.pathsep)))
+
+# Shell configuration files, relative to the home directory
+SHELL_CONFIG_FILES = {
+    "bash": ".bashrc",
+    "zsh": ".zshrc",
+    "fish": ".config/fish/config.fish",
+}
+
+# Version of the running interpreter, e.g. "3.11.4"
+PYTHON_VERSION = "{}.{}.{}".format(*sys.version_info[:3])
+
+# Oldest Git that sgit works with (git status --porcelain=v2 arrived in 2.11)
+MIN_GIT_VERSION = (2, 11)
+
+# Results of previous runs: Python version, Git version and the key of the last install
+INSTALL_CACHE_FILE = os.path.expanduser("~/.sgit_install_cache")
+
+# The sgit script, shipped next to this installer and installed byte for byte
+SGIT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sgit.py")
+
+def colored(text, color=RESET, bold=False):
+    """Wrap text in ANSI color codes."""
+    if bold:
+        return f"{BOLD}{color}{text}{RESET}"
+    return f"{color}{text}{RESET}"
 
 def print_colored(text, color=RESET, bold=False):
     """Print colored text."""
-    if bold:
-        print(f"{BOLD}{color}{text}{RESET}")
-    else:
-        print(f"{color}{text}{RESET}")
+    print(colored(text, color, bold))
 
-def run_command(command):
-    """Run a shell command and return its output."""
+def start_command(command):
+    """Start a command (given as an argv list) without waiting for it."""
     try:
-        result = subprocess.run(command, shell=True, check=True, 
-                               text=True, capture_output=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
+        return subprocess.Popen(command, text=True,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError:
         return None
 
-def check_dependencies():
-    """Check if required dependencies are installed."""
-    print_colored("Checking dependencies...", BLUE, bold=True)
-    
-    # Check Python version
-    python_version = platform.python_version()
-    if python_version:
-        major, minor, _ = map(int, python_version.split('.'))
-        if major < 3 or (major == 3 and minor < 6):
-            print_colored(f"Error: Python 3.6+ required, found {python_version}", RED)
-            sys.exit(1)
-        print_colored(f"✓ Python {python_version} detected", GREEN)
-    else:
-        print_colored("Error: Python 3.6+ is required", RED)
-        sys.exit(1)
-    
-    # Check Git installation
-    git_version = run_command("git --version")
-    if git_version:
-        print_colored(f"✓ {git_version} detected", GREEN)
-    else:
-        print_colored("Error: Git is required but not found", RED)
-        sys.exit(1)
-    
-    print()
-
-def get_install_location():
-    """Determine the best location to install the script."""
-    print_colored("Finding the best installation location...", BLUE, bold=True)
-    
-    # Option 1: /usr/local/bin (preferred, requires root)
-    if os.access("/usr/local/bin", os.W_OK):
-        print_colored("✓ /usr/local/bin is writable", GREEN)
-        return "/usr/local/bin"
-    
-    # Option 2: ~/bin if it exists and is in PATH
-    home_bin = os.path.expanduser("~/bin")
-    if os.path.exists(home_bin):
-        if home_bin in os.environ.get("PATH", ""):
-            print_colored(f"✓ {home_bin} exists and is in PATH", GREEN)
-            return home_bin
-        else:
-            print_colored(f"✓ {home_bin} exists but is not in PATH", YELLOW)
-            print_colored("  Will add to PATH in shell configuration", BLUE)
-            return home_bin
-    
-    # Option 3: Create ~/bin
-    print_colored(f"Creating {home_bin} directory", BLUE)
-    os.makedirs(home_bin, exist_ok=True)
-    print_colored(f"✓ {home_bin} created", GREEN)
-    return home_bin
-
-def update_shell_config(bin_path):
-    """Update shell configuration to include the bin path in PATH."""
-    # Determine which shell is being used
-    shell = os.path.basename(os.environ.get("SHELL", ""))
-    home = os.path.expanduser("~")
-    
-    config_file = None
-    config_line = f'export PATH="$PATH:{bin_path}"'
-    
-    if shell == "bash":
-        config_file = os.path.join(home, ".bashrc")
-    elif shell == "zsh":
-        config_file = os.path.join(home, ".zshrc")
-    elif shell == "fish":
-        config_file = os.path.join(home, ".config/fish/config.fish")
-        config_line = f'set -gx PATH $PATH {bin_path}'
-    
-    if config_file:
-        # Check if PATH already contains bin_path
-        with open(config_file, 'a+') as f:
-            f.seek(0)
-            if bin_path not in f.read():
-                f.write(f"\n# Added by sgit installer\n{config_line}\n")
-                print_colored(f"✓ Added {bin_path} to PATH in {config_file}", GREEN)
-                print_colored(f"  Please run 'source {config_file}' or restart your terminal", YELLOW)
-            else:
-                print_colored(f"✓ {bin_path} already in PATH", GREEN)
-    else:
-        print_colored(f"Could not detect shell configuration file. Please add {bin_path} to your PATH manually.", YELLOW)
+def finish_command(process):
+    """Wait for a command from start_command() and return its output."""
+    if process is None:
+        return None
+    stdout, _ = process.communicate()
+    return stdout.strip() if process.returncode == 0 else None
 
-def install_sgit(install_path):
-    """Install the sgit script to the specified location."""
-    print_colored("\nInstalling sgit...", BLUE, bold=True)
-    
-    # Paths for the script and symlink
-    sgit_path = os.path.join(install_path, "sgit")
-    sgit_s_path = os.path.join(install_path, "sgit-s")
-    
-    # Write the script
-    with open(sgit_path, 'w') as f:
-        f.write(SGIT_SCRIPT)
-    
-    # Make executable
-    os.chmod(sgit_path, os.stat(sgit_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    
-    print_colored(f"✓ Installed script to {sgit_path}", GREEN)
-    
-    # Create symlink for sgit-s
-    if os.path.exists(sgit_s_path):
-        os.remove(sgit_s_path)
-    
-    # Create symlink (or copy if symlinks not supported)
+def read_install_cache():
+    """Read the cached [python_version, git_version, install_key] entries."""
     try:
-        os.symlink(sgit_path, sgit_s_path)
-        print_colored(f"✓ Created symlink at {sgit_s_path}", GREEN)
-    except:
-        # Fallback to copy if symlink fails
-        shutil.copy2(sgit_path, sgit_s_path)
-        print_colored(f"✓ Created copy at {sgit_s_path} (symlink failed)", YELLOW)
-    
-    return sgit_path
-
-def show_usage_info(sgit_path):
-    """Show usage information for the installed sgit tool."""
-    print_colored("\nSGit Installation Complete!", GREEN, bold=True)
-    print_colored("\nUsage Examples:", BLUE, bold=True)
-    print_colored("  sgit                  - Commit changes with current version", RESET)
-    print_colored("  sgit -M               - Increment major version and commit", RESET)
-    print_colored("  sgit -m               - Increment minor version and commit", RESET)
-    print_colored("  sgit -p               - Increment patch version and commit", RESET)
-    print_colored("  sgit -s 01.02.03      - Set version to 01.02.03", RESET)
-    
-    # Check if sgit is in PATH
-    if sgit_path not in os.environ.get("PATH", "").split(os.pathsep):
-        print_colored("\nNOTE: You may need to restart your terminal or source your shell configuration", YELLOW)
-        print_colored("      file before using sgit if it was installed to a new directory.", YELLOW)
-
-def main():
-    """Main installation function."""
-    print_colored("\n=== SGit - Semantic Versioning Git Tool Installer ===\n", BLUE, bold=True)
-    
-    # Check dependencies
-    check_dependencies()
-    
-    # Get installation location
-    install_path = get_install_location()
-    
-    # Update PATH if needed
-    if install_path == os.path.expanduser("~/bin") and install_path not in os.environ.get("PATH", ""):
-        update_shell_config(install_path)
-    
-    # Install the script
-    sgit_path = install_sgit(install_path)
-    
-    # Show usage information
-    show_usage_info(sgit_path)
-    
-    print_colored("\nThank you for installing SGit!\n", GREEN, bold=True)
-
-if __name__ == "__main__":
-    main()
-, version):
-                return version
-            else:
-                print(f"\\033[93mWarning: Invalid version format in {VERSION_FILE}, resetting to {DEFAULT_VERSION}\\033[0m")
-    else:
-        print(f"\\033[93mCreating new {VERSION_FILE} with initial version {DEFAULT_VERSION}\\033[0m")
-    
-    # If file doesn't exist or has invalid format, create with default version
-    with open(version_path, 'w') as f:
-        f.write(DEFAULT_VERSION)
-    
-    return DEFAULT_VERSION
-
-def set_version(version):
-    """Set the version in the sgit.version file."""
-    # Validate version format
-    if not re.match(r'^\\d{2}\\.\\d{2}\\.\\d{2}
-
-def main():
-    parser = argparse.ArgumentParser(description="Semantic Versioning Git Helper")
-    parser.add_argument('-M', action='store_true', help='Increment major version')
-    parser.add_argument('-m', action='store_true', help='Increment minor version')
-    parser.add_argument('-p', action='store_true', help='Increment patch version')
-    parser.add_argument('-s', metavar='VERSION', help='Set specific version (XX.XX.XX)')
-    
-    args = parser.parse_args()
-    
-    # Handle setting specific version with sgit -s
-    if args.s:
-        set_version(args.s)
-        return
-    
-    # Get current version
-    current_version = get_current_version()
-    
-    # Handle version increments
-    incremented = []
-    if args.M or args.m or args.p:
-        new_version, incremented = increment_version(current_version, args.M, args.m, args.p)
-        set_version(new_version)
-        current_version = new_version
-    
-    # Get changed files
-    changed_files = get_changed_files()
-    
-    # Show files to be committed
-    print("\\n\\033[1mFiles to be committed:\\033[0m")
-    for i, (filename, status_text, _) in enumerate(changed_files, 1):
-        print(f"{i}. {status_text} {filename}")
-    
-    # Ask if user wants to remove any files
-    print("\\nEnter indices of files to exclude (comma-separated) or press Enter to include all:")
-    exclude_input = input("> ").strip()
-    
-    # Create a list for files to add
-    files_to_add = []
-    
-    if exclude_input:
-        # Parse the indices to exclude
-        try:
-            exclude_indices = [int(idx.strip()) for idx in exclude_input.split(',') if idx.strip().isdigit()]
-            # Only include files not in the exclude list
-            files_to_add = [file[0] for i, file in enumerate(changed_files, 1) if i not in exclude_indices]
-        except ValueError:
-            print("\\033[93mInvalid input. Including all files.\\033[0m")
-            files_to_add = [file[0] for file in changed_files]
-        
-        if not files_to_add:
-            print("\\033[93mNo files selected for commit. Exiting.\\033[0m")
-            sys.exit(0)
-    else:
-        # Include all files if no exclusion
-        files_to_add = [file[0] for file in changed_files]
-    
-    # Display the list of files that will be added
-    print("\\n\\033[1mFiles that will be added to commit:\\033[0m")
-    for i, filename in enumerate(files_to_add, 1):
-        print(f"{i}. {filename}")
-    
-    # Add files to staging
-    if files_to_add:
-        # First reset any staged files
-        run_command("git reset", capture_output=False)
-        
-        # Use different approaches to handle file adding
-        try:
-            # Method 1: Use git add . and then remove files we don't want
-            run_command("git add .", capture_output=False)
-            
-            # If we're not adding all files, we need to remove some
-            all_files = [file[0] for file in changed_files]
-            files_to_remove = [file for file in all_files if file not in files_to_add]
-            
-            # Remove any files that should be excluded
-            for file in files_to_remove:
-                print(f"\\033[94mExcluding: {file}\\033[0m")
-                run_command(f"git reset HEAD \\"{file}\\"", capture_output=False)
-                
-            print(f"\\n\\033[92mAdded {len(files_to_add)} file(s) to commit\\033[0m")
-        except Exception as e:
-            print(f"\\033[91mError adding files: {str(e)}\\033[0m")
-            sys.exit(1)
-    
-    # Get commit message
-    print("\\nEnter commit message (press Enter for timestamp):")
-    commit_message = input("> ").strip()
-    
-    if not commit_message:
-        # Use Unix timestamp as default message
-        commit_message = f"Automatic commit at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    
-    # Format version with stars for the commit
-    version_display = format_version_with_stars(current_version, incremented)
-    
-    # Create full commit message with version
-    full_commit_message = f"[{version_display}] {commit_message}"
-    
-    # Commit and push
-    print(f"\\n\\033[94mCommitting with message: \\"{full_commit_message}\\"\\033[0m")
-    run_command(f"git commit -m \\"{full_commit_message}\\"", capture_output=False)
-    
-    print("\\n\\033[94mPushing to remote repository...\\033[0m")
-    push_result = run_command("git push", capture_output=True)
-    
-    print(f"\\n\\033[92mSuccessfully pushed with version {current_version}\\033[0m")
-
-if __name__ == "__main__":
-    main()
-"""
+        with open(INSTALL_CACHE_FILE, 'r') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        lines = []
+    # Missing entries read as empty strings, which never match
+    return (lines + ["", "", ""])[:3]
+
+def write_install_cache(cache):
+    """Remember probe results and the last install so later runs can skip them."""
+    try:
+        with open(INSTALL_CACHE_FILE, 'w') as f:
+            f.write("\n".join(cache) + "\n")
+    except OSError:
+        pass
 
-def print_colored(text, color=RESET, bold=False):
-    """Print colored text."""
-    if bold:
-        print(f"{BOLD}{color}{text}{RESET}")
-    else:
-        print(f"{color}{text}{RESET}")
+def read_sgit_script():
+    """Read the sgit script as raw bytes, ready to be written out."""
+    try:
+        with open(SGIT_SOURCE, 'rb') as f:
+            return f.read()
+    except OSError:
+        print_colored(f"Error: Could not read {SGIT_SOURCE}, run the installer from the sgit checkout", RED)
+        sys.exit(1)
 
-def run_command(command):
-    """Run a shell command and return its output."""
+def get_install_key(script, install_path):
+    """Identify an install by the script contents, Python version and location."""
+    key = hashlib.blake2b(digest_size=16)
+    for part in (script, PYTHON_VERSION.encode(), install_path.encode()):
+        key.update(part)
+    return key.hexdigest()
+
+def cached_git_version(cache):
+    """Return the Git version probed by a previous run with the same Python, if any."""
+    if cache[0] == PYTHON_VERSION and cache[1]:
+        return cache[1]
+    return None
+
+def parse_git_version(git_version):
+    """Turn `git --version` output such as "git version 2.39.5" into (2, 39)."""
     try:
-        result = subprocess.run(command, shell=True, check=True, 
-                               text=True, capture_output=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
+        major, minor = git_version.split()[2].split('.')[:2]
+        return int(major), int(minor)
+    except (IndexError, ValueError):
         return None
 
-def check_dependencies():
-    """Check if required dependencies are installed."""
+def check_dependencies(cache, git_probe=None):
+    """Check if required dependencies are installed.
+    
+    git_probe is an already started `git --version` process, if any.
+    """
     print_colored("Checking dependencies...", BLUE, bold=True)
     
     # Check Python version
-    python_version = platform.python_version()
-    if python_version:
-        major, minor, _ = map(int, python_version.split('.'))
-        if major < 3 or (major == 3 and minor < 6):
-            print_colored(f"Error: Python 3.6+ required, found {python_version}", RED)
+    python_version = PYTHON_VERSION
+    if sys.version_info < (3, 6):
+        print_colored(f"Error: Python 3.6+ required, found {python_version}", RED)
+        sys.exit(1)
+    print_colored(f"✓ Python {python_version} detected", GREEN)
+    
+    # Check Git installation, reusing the probe from a previous run with the same Python
+    git_version = cached_git_version(cache)
+    cached = git_version is not None
+    if not cached:
+        git_version = finish_command(git_probe or start_command(["git", "--version"]))
+        if not git_version:
+            print_colored("Error: Git is required but not found", RED)
             sys.exit(1)
-        print_colored(f"✓ Python {python_version} detected", GREEN)
-    else:
-        print_colored("Error: Python 3.6+ is required", RED)
+    
+    # Unparsable versions are let through rather than blocking the install
+    version = parse_git_version(git_version)
+    if version and version < MIN_GIT_VERSION:
+        print_colored("Error: Git {}.{}+ required, found {}".format(*MIN_GIT_VERSION, git_version), RED)
         sys.exit(1)
     
-    # Check Git installation
-    git_version = run_command("git --version")
-    if git_version:
-        print_colored(f"✓ {git_version} detected", GREEN)
+    if cached:
+        print_colored(f"✓ {git_version} detected (cached)", GREEN)
     else:
-        print_colored("Error: Git is required but not found", RED)
-        sys.exit(1)
+        print_colored(f"✓ {git_version} detected", GREEN)
+        # Only a usable Git is remembered, so an upgrade is picked up next run
+        cache[0], cache[1] = python_version, git_version
+        write_install_cache(cache)
     
     print()
 
@@ -557,7 +179,7 @@ def get_install_location():
     # Option 2: ~/bin if it exists and is in PATH
     home_bin = os.path.expanduser("~/bin")
     if os.path.exists(home_bin):
-        if home_bin in os.environ.get("PATH", ""):
+        if home_bin in _PATH_ENTRIES:
             print_colored(f"✓ {home_bin} exists and is in PATH", GREEN)
             return home_bin
         else:
@@ -573,418 +195,52 @@ def get_install_location():
 
 def update_shell_config(bin_path):
     """Update shell configuration to include the bin path in PATH."""
+    # Already reachable in this session, no need to touch the config file
+    if bin_path in _PATH_ENTRIES:
+        print_colored(f"✓ {bin_path} already in PATH", GREEN)
+        return
+    
     # Determine which shell is being used
     shell = os.path.basename(os.environ.get("SHELL", ""))
-    home = os.path.expanduser("~")
+    config_name = SHELL_CONFIG_FILES.get(shell)
     
-    config_file = None
-    config_line = f'export PATH="$PATH:{bin_path}"'
-    
-    if shell == "bash":
-        config_file = os.path.join(home, ".bashrc")
-    elif shell == "zsh":
-        config_file = os.path.join(home, ".zshrc")
-    elif shell == "fish":
-        config_file = os.path.join(home, ".config/fish/config.fish")
+    if shell == "fish":
         config_line = f'set -gx PATH $PATH {bin_path}'
-    
-    if config_file:
-        # Check if PATH already contains bin_path
-        with open(config_file, 'a+') as f:
-            f.seek(0)
-            if bin_path not in f.read():
-                f.write(f"\n# Added by sgit installer\n{config_line}\n")
-                print_colored(f"✓ Added {bin_path} to PATH in {config_file}", GREEN)
-                print_colored(f"  Please run 'source {config_file}' or restart your terminal", YELLOW)
-            else:
-                print_colored(f"✓ {bin_path} already in PATH", GREEN)
     else:
-        print_colored(f"Could not detect shell configuration file. Please add {bin_path} to your PATH manually.", YELLOW)
-
-def install_sgit(install_path):
-    """Install the sgit script to the specified location."""
-    print_colored("\nInstalling sgit...", BLUE, bold=True)
-    
-    # Paths for the script and symlink
-    sgit_path = os.path.join(install_path, "sgit")
-    sgit_s_path = os.path.join(install_path, "sgit-s")
-    
-    # Write the script
-    with open(sgit_path, 'w') as f:
-        f.write(SGIT_SCRIPT)
-    
-    # Make executable
-    os.chmod(sgit_path, os.stat(sgit_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    
-    print_colored(f"✓ Installed script to {sgit_path}", GREEN)
-    
-    # Create symlink for sgit-s
-    if os.path.exists(sgit_s_path):
-        os.remove(sgit_s_path)
-    
-    # Create symlink (or copy if symlinks not supported)
-    try:
-        os.symlink(sgit_path, sgit_s_path)
-        print_colored(f"✓ Created symlink at {sgit_s_path}", GREEN)
-    except:
-        # Fallback to copy if symlink fails
-        shutil.copy2(sgit_path, sgit_s_path)
-        print_colored(f"✓ Created copy at {sgit_s_path} (symlink failed)", YELLOW)
-    
-    return sgit_path
-
-def show_usage_info(sgit_path):
-    """Show usage information for the installed sgit tool."""
-    print_colored("\nSGit Installation Complete!", GREEN, bold=True)
-    print_colored("\nUsage Examples:", BLUE, bold=True)
-    print_colored("  sgit                  - Commit changes with current version", RESET)
-    print_colored("  sgit -M               - Increment major version and commit", RESET)
-    print_colored("  sgit -m               - Increment minor version and commit", RESET)
-    print_colored("  sgit -p               - Increment patch version and commit", RESET)
-    print_colored("  sgit -s 01.02.03      - Set version to 01.02.03", RESET)
-    
-    # Check if sgit is in PATH
-    if sgit_path not in os.environ.get("PATH", "").split(os.pathsep):
-        print_colored("\nNOTE: You may need to restart your terminal or source your shell configuration", YELLOW)
-        print_colored("      file before using sgit if it was installed to a new directory.", YELLOW)
-
-def main():
-    """Main installation function."""
-    print_colored("\n=== SGit - Semantic Versioning Git Tool Installer ===\n", BLUE, bold=True)
-    
-    # Check dependencies
-    check_dependencies()
+        config_line = f'export PATH="$PATH:{bin_path}"'
     
-    # Get installation location
-    install_path = get_install_location()
-    
-    # Update PATH if needed
-    if install_path == os.path.expanduser("~/bin") and install_path not in os.environ.get("PATH", ""):
-        update_shell_config(install_path)
-    
-    # Install the script
-    sgit_path = install_sgit(install_path)
-    
-    # Show usage information
-    show_usage_info(sgit_path)
-    
-    print_colored("\nThank you for installing SGit!\n", GREEN, bold=True)
-
-if __name__ == "__main__":
-    main()
-, version):
-        print("\\033[91mError: Version must be in format XX.XX.XX (e.g., 01.02.03)\\033[0m")
-        sys.exit(1)
-    
-    git_root = get_git_root()
-    version_path = os.path.join(git_root, VERSION_FILE)
-    
-    with open(version_path, 'w') as f:
-        f.write(version)
-    
-    print(f"\\033[92mVersion set to {version}\\033[0m")
-    return version
-
-def increment_version(current_version, major=False, minor=False, patch=False):
-    """Increment the version based on which component should be increased."""
-    parts = current_version.split('.')
-    major_val = int(parts[0])
-    minor_val = int(parts[1])
-    patch_val = int(parts[2])
-    
-    # Store which components were incremented for adding stars later
-    incremented = []
-    
-    if major:
-        major_val = (major_val + 1) % 100
-        minor_val = 0
-        patch_val = 0
-        incremented.append('major')
-    
-    if minor:
-        minor_val = (minor_val + 1) % 100
-        patch_val = 0
-        incremented.append('minor')
-    
-    if patch:
-        patch_val = (patch_val + 1) % 100
-        incremented.append('patch')
-    
-    # Format with leading zeros
-    new_version = f"{major_val:02d}.{minor_val:02d}.{patch_val:02d}"
-    
-    return new_version, incremented
-
-def format_version_with_stars(version, incremented):
-    """Format the version with stars next to incremented components."""
-    if not incremented:
-        return version  # No stars if nothing was incremented
-    
-    parts = version.split('.')
-    
-    # Create the version string with stars
-    version_with_stars = ""
-    if 'major' in incremented:
-        version_with_stars += f"*{parts[0]}."
-    else:
-        version_with_stars += f"{parts[0]}."
+    if config_name:
+        config_file = os.path.join(os.path.expanduser("~"), config_name)
         
-    if 'minor' in incremented:
-        version_with_stars += f"*{parts[1]}."
-    else:
-        version_with_stars += f"{parts[1]}."
-        
-    if 'patch' in incremented:
-        version_with_stars += f"*{parts[2]}"
-    else:
-        version_with_stars += f"{parts[2]}"
-    
-    return version_with_stars
-
-def get_changed_files():
-    """Get a list of files changed in the working directory."""
-    # Get all changes (including untracked files)
-    status_output = run_command("git status --porcelain")
-    
-    if not status_output:
-        print("\\033[93mNo changes to commit.\\033[0m")
-        sys.exit(0)
-    
-    files = []
-    for line in status_output.split('\n'):
-        if line.strip():
-            # The first two characters are the status codes, but we must not strip them
-            # as that would remove leading spaces that are part of the format
-            status_code = line[:2].strip()
-            filename = line[2:].strip()
-
-            if status_code == '??':
-                status_text = "\033[92mINSERT\033[0m"
-            
-            elif status_code == 'D':
-                status_text = "\033[91mDELETE\033[0m"
-            
-            elif status_code == 'M':
-                status_text = "\033[93mUPDATE\033[0m"
-                
-            else:
-                status_text = "Unknown"
-
-            files.append((filename, status_text, status_code))
-    
-    return files
-
-def main():
-    parser = argparse.ArgumentParser(description="Semantic Versioning Git Helper")
-    parser.add_argument('-M', action='store_true', help='Increment major version')
-    parser.add_argument('-m', action='store_true', help='Increment minor version')
-    parser.add_argument('-p', action='store_true', help='Increment patch version')
-    parser.add_argument('-s', metavar='VERSION', help='Set specific version (XX.XX.XX)')
-    
-    args = parser.parse_args()
-    
-    # Handle setting specific version with sgit -s
-    if args.s:
-        set_version(args.s)
-        return
-    
-    # Get current version
-    current_version = get_current_version()
-    
-    # Handle version increments
-    incremented = []
-    if args.M or args.m or args.p:
-        new_version, incremented = increment_version(current_version, args.M, args.m, args.p)
-        set_version(new_version)
-        current_version = new_version
-    
-    # Get changed files
-    changed_files = get_changed_files()
-    
-    # Show files to be committed
-    print("\\n\\033[1mFiles to be committed:\\033[0m")
-    for i, (filename, status_text, _) in enumerate(changed_files, 1):
-        print(f"{i}. {status_text} {filename}")
-    
-    # Ask if user wants to remove any files
-    print("\\nEnter indices of files to exclude (comma-separated) or press Enter to include all:")
-    exclude_input = input("> ").strip()
-    
-    # Create a list for files to add
-    files_to_add = []
-    
-    if exclude_input:
-        # Parse the indices to exclude
+        # Check if PATH already contains bin_path, scanning the file through
+        # mmap instead of reading it all into a string
+        found = False
         try:
-            exclude_indices = [int(idx.strip()) for idx in exclude_input.split(',') if idx.strip().isdigit()]
-            # Only include files not in the exclude list
-            files_to_add = [file[0] for i, file in enumerate(changed_files, 1) if i not in exclude_indices]
-        except ValueError:
-            print("\\033[93mInvalid input. Including all files.\\033[0m")
-            files_to_add = [file[0] for file in changed_files]
+            with open(config_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    found = mm.find(bin_path.encode()) != -1
+        except (FileNotFoundError, ValueError):
+            # Missing or empty config file (empty files cannot be mapped)
+            pass
         
-        if not files_to_add:
-            print("\\033[93mNo files selected for commit. Exiting.\\033[0m")
-            sys.exit(0)
-    else:
-        # Include all files if no exclusion
-        files_to_add = [file[0] for file in changed_files]
-    
-    # Display the list of files that will be added
-    print("\\n\\033[1mFiles that will be added to commit:\\033[0m")
-    for i, filename in enumerate(files_to_add, 1):
-        print(f"{i}. {filename}")
-    
-    # Add files to staging
-    if files_to_add:
-        # First reset any staged files
-        run_command("git reset", capture_output=False)
-        
-        # Use different approaches to handle file adding
-        try:
-            # Method 1: Use git add . and then remove files we don't want
-            run_command("git add .", capture_output=False)
-            
-            # If we're not adding all files, we need to remove some
-            all_files = [file[0] for file in changed_files]
-            files_to_remove = [file for file in all_files if file not in files_to_add]
-            
-            # Remove any files that should be excluded
-            for file in files_to_remove:
-                print(f"\\033[94mExcluding: {file}\\033[0m")
-                run_command(f"git reset HEAD \\"{file}\\"", capture_output=False)
-                
-            print(f"\\n\\033[92mAdded {len(files_to_add)} file(s) to commit\\033[0m")
-        except Exception as e:
-            print(f"\\033[91mError adding files: {str(e)}\\033[0m")
-            sys.exit(1)
-    
-    # Get commit message
-    print("\\nEnter commit message (press Enter for timestamp):")
-    commit_message = input("> ").strip()
-    
-    if not commit_message:
-        # Use Unix timestamp as default message
-        commit_message = f"Automatic commit at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    
-    # Format version with stars for the commit
-    version_display = format_version_with_stars(current_version, incremented)
-    
-    # Create full commit message with version
-    full_commit_message = f"[{version_display}] {commit_message}"
-    
-    # Commit and push
-    print(f"\\n\\033[94mCommitting with message: \\"{full_commit_message}\\"\\033[0m")
-    run_command(f"git commit -m \\"{full_commit_message}\\"", capture_output=False)
-    
-    print("\\n\\033[94mPushing to remote repository...\\033[0m")
-    push_result = run_command("git push", capture_output=True)
-    
-    print(f"\\n\\033[92mSuccessfully pushed with version {current_version}\\033[0m")
-
-if __name__ == "__main__":
-    main()
-'''
-
-def print_colored(text, color=RESET, bold=False):
-    """Print colored text."""
-    if bold:
-        print(f"{BOLD}{color}{text}{RESET}")
-    else:
-        print(f"{color}{text}{RESET}")
-
-def run_command(command):
-    """Run a shell command and return its output."""
-    try:
-        result = subprocess.run(command, shell=True, check=True, 
-                               text=True, capture_output=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        return None
-
-def check_dependencies():
-    """Check if required dependencies are installed."""
-    print_colored("Checking dependencies...", BLUE, bold=True)
-    
-    # Check Python version
-    python_version = platform.python_version()
-    if python_version:
-        major, minor, _ = map(int, python_version.split('.'))
-        if major < 3 or (major == 3 and minor < 6):
-            print_colored(f"Error: Python 3.6+ required, found {python_version}", RED)
-            sys.exit(1)
-        print_colored(f"✓ Python {python_version} detected", GREEN)
-    else:
-        print_colored("Error: Python 3.6+ is required", RED)
-        sys.exit(1)
-    
-    # Check Git installation
-    git_version = run_command("git --version")
-    if git_version:
-        print_colored(f"✓ {git_version} detected", GREEN)
-    else:
-        print_colored("Error: Git is required but not found", RED)
-        sys.exit(1)
-    
-    print()
-
-def get_install_location():
-    """Determine the best location to install the script."""
-    print_colored("Finding the best installation location...", BLUE, bold=True)
-    
-    # Option 1: /usr/local/bin (preferred, requires root)
-    if os.access("/usr/local/bin", os.W_OK):
-        print_colored("✓ /usr/local/bin is writable", GREEN)
-        return "/usr/local/bin"
-    
-    # Option 2: ~/bin if it exists and is in PATH
-    home_bin = os.path.expanduser("~/bin")
-    if os.path.exists(home_bin):
-        if home_bin in os.environ.get("PATH", ""):
-            print_colored(f"✓ {home_bin} exists and is in PATH", GREEN)
-            return home_bin
-        else:
-            print_colored(f"✓ {home_bin} exists but is not in PATH", YELLOW)
-            print_colored("  Will add to PATH in shell configuration", BLUE)
-            return home_bin
-    
-    # Option 3: Create ~/bin
-    print_colored(f"Creating {home_bin} directory", BLUE)
-    os.makedirs(home_bin, exist_ok=True)
-    print_colored(f"✓ {home_bin} created", GREEN)
-    return home_bin
-
-def update_shell_config(bin_path):
-    """Update shell configuration to include the bin path in PATH."""
-    # Determine which shell is being used
-    shell = os.path.basename(os.environ.get("SHELL", ""))
-    home = os.path.expanduser("~")
-    
-    config_file = None
-    config_line = f'export PATH="$PATH:{bin_path}"'
-    
-    if shell == "bash":
-        config_file = os.path.join(home, ".bashrc")
-    elif shell == "zsh":
-        config_file = os.path.join(home, ".zshrc")
-    elif shell == "fish":
-        config_file = os.path.join(home, ".config/fish/config.fish")
-        config_line = f'set -gx PATH $PATH {bin_path}'
-    
-    if config_file:
-        # Check if PATH already contains bin_path
-        with open(config_file, 'a+') as f:
-            f.seek(0)
-            if bin_path not in f.read():
+        if not found:
+            with open(config_file, 'a') as f:
                 f.write(f"\n# Added by sgit installer\n{config_line}\n")
-                print_colored(f"✓ Added {bin_path} to PATH in {config_file}", GREEN)
-                print_colored(f"  Please run 'source {config_file}' or restart your terminal", YELLOW)
-            else:
-                print_colored(f"✓ {bin_path} already in PATH", GREEN)
+            print_colored(f"✓ Added {bin_path} to PATH in {config_file}", GREEN)
+            print_colored(f"  Please run 'source {config_file}' or restart your terminal", YELLOW)
+        else:
+            print_colored(f"✓ {bin_path} already in PATH", GREEN)
     else:
         print_colored(f"Could not detect shell configuration file. Please add {bin_path} to your PATH manually.", YELLOW)
 
-def install_sgit(install_path):
+def remove_stale(path):
+    """Remove a leftover file or link at path, if there is one."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def install_sgit(install_path, script):
     """Install the sgit script to the specified location."""
     print_colored("\nInstalling sgit...", BLUE, bold=True)
     
@@ -992,25 +248,31 @@ def install_sgit(install_path):
     sgit_path = os.path.join(install_path, "sgit")
     sgit_s_path = os.path.join(install_path, "sgit-s")
     
-    # Write the script
-    with open(sgit_path, 'w') as f:
-        f.write(SGIT_SCRIPT)
-    
-    # Make executable
-    os.chmod(sgit_path, os.stat(sgit_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    # Write the script to a fresh temporary file (so it is executable from
+    # the start) and rename it into place, so an interrupted install never
+    # leaves a truncated sgit behind
+    tmp_path = sgit_path + ".tmp"
+    remove_stale(tmp_path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+    try:
+        os.write(fd, script)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, sgit_path)
     
     print_colored(f"✓ Installed script to {sgit_path}", GREEN)
     
-    # Create symlink for sgit-s
-    if os.path.exists(sgit_s_path):
-        os.remove(sgit_s_path)
-    
-    # Create symlink (or copy if symlinks not supported)
+    # Create symlink for sgit-s, atomically replacing any previous one
+    # (or copy if symlinks not supported)
+    tmp_s_path = sgit_s_path + ".tmp"
     try:
-        os.symlink(sgit_path, sgit_s_path)
+        remove_stale(tmp_s_path)
+        os.symlink(sgit_path, tmp_s_path)
+        os.replace(tmp_s_path, sgit_s_path)
         print_colored(f"✓ Created symlink at {sgit_s_path}", GREEN)
-    except:
+    except OSError:
         # Fallback to copy if symlink fails
+        remove_stale(sgit_s_path)
         shutil.copy2(sgit_path, sgit_s_path)
         print_colored(f"✓ Created copy at {sgit_s_path} (symlink failed)", YELLOW)
     
@@ -1018,35 +280,62 @@ def install_sgit(install_path):
 
 def show_usage_info(sgit_path):
     """Show usage information for the installed sgit tool."""
-    print_colored("\nSGit Installation Complete!", GREEN, bold=True)
-    print_colored("\nUsage Examples:", BLUE, bold=True)
-    print_colored("  sgit                  - Commit changes with current version", RESET)
-    print_colored("  sgit -M               - Increment major version and commit", RESET)
-    print_colored("  sgit -m               - Increment minor version and commit", RESET)
-    print_colored("  sgit -p               - Increment patch version and commit", RESET)
-    print_colored("  sgit -s 01.02.03      - Set version to 01.02.03", RESET)
-    
-    # Check if sgit is in PATH
-    if sgit_path not in os.environ.get("PATH", "").split(os.pathsep):
-        print_colored("\nNOTE: You may need to restart your terminal or source your shell configuration", YELLOW)
-        print_colored("      file before using sgit if it was installed to a new directory.", YELLOW)
+    lines = [
+        colored("\nSGit Installation Complete!", GREEN, bold=True),
+        colored("\nUsage Examples:", BLUE, bold=True),
+        colored("  sgit                  - Commit changes with current version"),
+        colored("  sgit -M               - Increment major version and commit"),
+        colored("  sgit -m               - Increment minor version and commit"),
+        colored("  sgit -p               - Increment patch version and commit"),
+        colored("  sgit -s 01.02.03      - Set version to 01.02.03"),
+    ]
+    
+    # Check if sgit's directory is in PATH
+    if os.path.dirname(sgit_path) not in _PATH_ENTRIES:
+        lines.append(colored("\nNOTE: You may need to restart your terminal or source your shell configuration", YELLOW))
+        lines.append(colored("      file before using sgit if it was installed to a new directory.", YELLOW))
+    
+    # Emit the whole block with a single write
+    print("\n".join(lines))
 
 def main():
     """Main installation function."""
+    parser = argparse.ArgumentParser(description="Install the sgit tool")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help=f'Forget the results cached in {INSTALL_CACHE_FILE} and reinstall')
+    args = parser.parse_args()
+    
     print_colored("\n=== SGit - Semantic Versioning Git Tool Installer ===\n", BLUE, bold=True)
     
-    # Check dependencies
-    check_dependencies()
+    if args.clear_cache:
+        remove_stale(INSTALL_CACHE_FILE)
+    cache = read_install_cache()
+    script = read_sgit_script()
+    
+    # Start probing Git now so it runs while the install location is chosen
+    git_probe = None if cached_git_version(cache) else start_command(["git", "--version"])
     
     # Get installation location
     install_path = get_install_location()
     
+    # Nothing to do if this exact script was already installed here
+    install_key = get_install_key(script, install_path)
+    if cache[2] == install_key and os.path.isfile(os.path.join(install_path, "sgit")):
+        print_colored("\n✓ sgit is up to date", GREEN, bold=True)
+        return
+    
+    # Check dependencies
+    check_dependencies(cache, git_probe)
+    
     # Update PATH if needed
-    if install_path == os.path.expanduser("~/bin") and install_path not in os.environ.get("PATH", ""):
+    if install_path == os.path.expanduser("~/bin") and install_path not in _PATH_ENTRIES:
         update_shell_config(install_path)
     
     # Install the script
-    sgit_path = install_sgit(install_path)
+    sgit_path = install_sgit(install_path, script)
+    
+    cache[2] = install_key
+    write_install_cache(cache)
     
     # Show usage information
     show_usage_info(sgit_path)
@@ -24,75 +24,225 @@ import sys
 import subprocess
 import time
 import re
-import argparse
-from datetime import datetime
+from collections import namedtuple
 
 VERSION_FILE = "sgit.version"
 DEFAULT_VERSION = "00.00.01"  # Start with 00.00.01 if no version file exists
 
+USAGE = "usage: sgit [-M] [-m] [-p] | sgit -s VERSION"
+
+# Version components (major, minor, patch) incremented by each flag
+_INCREMENT_FLAGS = {
+    '-M': (True, False, False),
+    '-m': (False, True, False),
+    '-p': (False, False, True),
+}
+
+# Upper bound on the bytes of path arguments per git call, well below ARG_MAX
+PATH_ARGS_BYTES = 64 * 1024
+
+_VERSION_RE = re.compile(r'(\d{2})\.(\d{2})\.(\d{2})')  # XX.XX.XX, used with fullmatch
+
+# ANSI color codes for output formatting, left empty when output is not a
+# terminal so pipes and scripts get plain text
+if sys.stdout.isatty():
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    BLUE = "\033[94m"
+    RED = "\033[91m"
+    BOLD = "\033[1m"
+    RESET = "\033[0m"
+else:
+    GREEN = YELLOW = BLUE = RED = BOLD = RESET = ""
+
+# Colored status labels, built once
+INSERT = f"{GREEN}INSERT{RESET}"
+DELETE = f"{RED}DELETE{RESET}"
+UPDATE = f"{YELLOW}UPDATE{RESET}"
+
+# Display labels keyed by short status code (the XY status without unchanged columns)
+_STATUS_TEXT = {
+    "??": INSERT,
+    "A": INSERT,
+    "D": DELETE,
+    "M": UPDATE,
+}
+
+# One changed file: its path, display label and raw porcelain XY status
+FileEntry = namedtuple('FileEntry', ['path', 'status_text', 'status_code'])
+
+def command_failed(command, detail):
+    """Report a failed command and exit.
+    
+    detail is None when the command's stderr went straight to the terminal.
+    """
+    print(f"{RED}Error executing: {' '.join(command)}{RESET}")
+    if detail is not None:
+        print(f"{RED}{detail}{RESET}")
+    sys.exit(1)
+
 def run_command(command, capture_output=True):
-    """Run a shell command and return its output."""
+    """Run a command (given as an argv list) and return its output."""
     try:
-        result = subprocess.run(command, shell=True, check=True, 
+        result = subprocess.run(command, check=True,
                                text=True, capture_output=capture_output)
-        return result.stdout.strip() if capture_output else None
+        # Only strip the trailing newline: porcelain output may begin with a space
+        return result.stdout.rstrip('\n') if capture_output else None
     except subprocess.CalledProcessError as e:
-        print(f"\033[91mError executing: {command}\033[0m")
-        print(f"\033[91m{e.stderr}\033[0m")
+        command_failed(command, e.stderr)
+    except OSError as e:
+        command_failed(command, e)
+
+def run_with_paths(command, paths):
+    """Run a git command on paths given after `--`, splitting long lists.
+    
+    Each call's path arguments are kept under PATH_ARGS_BYTES so a large
+    changeset never hits the system's argument size limit. Paths from git
+    status may carry surrogate escapes (names that are not valid UTF-8);
+    subprocess encodes them back to the exact bytes with os.fsencode.
+    """
+    batch, size = [], 0
+    for path in paths:
+        length = len(os.fsencode(path)) + 1
+        if batch and size + length > PATH_ARGS_BYTES:
+            run_command(command + ["--"] + batch, capture_output=False)
+            batch, size = [], 0
+        batch.append(path)
+        size += length
+    if batch:
+        run_command(command + ["--"] + batch, capture_output=False)
+
+def stream_records(command, separator=b'\0'):
+    """Run a command and yield its raw output records as they arrive.
+    
+    Records are split on separator while the command is still writing, so
+    the whole output is never held in memory at once. The command's stderr
+    goes straight to the terminal; a nonzero exit raises CalledProcessError
+    once the output is consumed.
+    """
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    except OSError as e:
+        command_failed(command, e)
+    
+    with process:
+        pending = b''
+        for chunk in iter(lambda: process.stdout.read1(65536), b''):
+            records = (pending + chunk).split(separator)
+            # The last piece may be an incomplete record; keep it for the next chunk
+            pending = records.pop()
+            yield from records
+        if pending:
+            yield pending
+    
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+GIT_PATHS_COMMAND = ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"]
+
+# Worktree root and .git directory, resolved at most once per run
+_git_paths = None
+
+def start_git_paths():
+    """Start resolving the worktree root and .git directory without waiting."""
+    try:
+        return subprocess.Popen(GIT_PATHS_COMMAND, text=True,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        command_failed(GIT_PATHS_COMMAND, e)
+
+def finish_git_paths(process):
+    """Wait for start_git_paths() and cache its result, exiting outside a repository."""
+    global _git_paths
+    stdout, _ = process.communicate()
+    if process.returncode:
+        print(f"{RED}Error: Not in a Git repository.{RESET}")
         sys.exit(1)
+    git_root, git_dir = stdout.rstrip('\n').split('\n')
+    _git_paths = git_root, git_dir
+    return _git_paths
+
+def get_git_paths():
+    """Get the worktree root and .git directory, resolved once with one git call."""
+    return _git_paths or finish_git_paths(start_git_paths())
 
 def get_git_root():
     """Get the root directory of the Git repository."""
+    return get_git_paths()[0]
+
+def get_version_path():
+    """Get the path of the version file at the repository root."""
+    return os.path.join(get_git_root(), VERSION_FILE)
+
+def write_version_file(version_path, version):
+    """Write a version to the version file with a single unbuffered write.
+    
+    The version goes to a temporary file that is renamed over the real one,
+    so an interrupted run never leaves a truncated version behind.
+    """
+    tmp_path = version_path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        return run_command("git rev-parse --show-toplevel")
-    except:
-        print("\033[91mError: Not in a Git repository.\033[0m")
-        sys.exit(1)
+        os.write(fd, version.encode())
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, version_path)
+
+def parse_version(version):
+    """Parse an XX.XX.XX string into a (major, minor, patch) tuple, or None if invalid."""
+    match = _VERSION_RE.fullmatch(version)
+    return (int(match[1]), int(match[2]), int(match[3])) if match else None
+
+def format_version(parts):
+    """Format a (major, minor, patch) tuple as XX.XX.XX."""
+    return "{:02d}.{:02d}.{:02d}".format(*parts)
 
 def get_current_version():
-    """Get the current version from the sgit.version file."""
-    git_root = get_git_root()
-    version_path = os.path.join(git_root, VERSION_FILE)
-    
-    if os.path.exists(version_path):
-        with open(version_path, 'r') as f:
-            version = f.read().strip()
-            # Validate the version format
-            if re.match(r'^\d{2}\.\d{2}\.\d{2}$', version):
-                return version
-            else:
-                print(f"\033[93mWarning: Invalid version format in {VERSION_FILE}, resetting to {DEFAULT_VERSION}\033[0m")
+    """Get the current version from the sgit.version file as a (major, minor, patch) tuple."""
+    version_path = get_version_path()
+    
+    # The file is a few bytes, so read it with one raw read
+    try:
+        fd = os.open(version_path, os.O_RDONLY)
+    except FileNotFoundError:
+        print(f"{YELLOW}Creating new {VERSION_FILE} with initial version {DEFAULT_VERSION}{RESET}")
     else:
-        print(f"\033[93mCreating new {VERSION_FILE} with initial version {DEFAULT_VERSION}\033[0m")
+        try:
+            version = os.read(fd, 64).decode(errors='replace').strip()
+        finally:
+            os.close(fd)
+        # Validate and parse the version in one pass
+        parts = parse_version(version)
+        if parts:
+            return parts
+        print(f"{YELLOW}Warning: Invalid version format in {VERSION_FILE}, resetting to {DEFAULT_VERSION}{RESET}")
     
     # If file doesn't exist or has invalid format, create with default version
-    with open(version_path, 'w') as f:
-        f.write(DEFAULT_VERSION)
+    write_version_file(version_path, DEFAULT_VERSION)
+    
+    return parse_version(DEFAULT_VERSION)
+
+def write_version(parts):
+    """Write an already valid (major, minor, patch) tuple to the sgit.version file."""
+    version = format_version(parts)
+    write_version_file(get_version_path(), version)
     
-    return DEFAULT_VERSION
+    print(f"{GREEN}Version set to {version}{RESET}")
+    return version
 
 def set_version(version):
-    """Set the version in the sgit.version file."""
+    """Set the version in the sgit.version file from a user-supplied string."""
     # Validate version format
-    if not re.match(r'^\d{2}\.\d{2}\.\d{2}$', version):
-        print("\033[91mError: Version must be in format XX.XX.XX (e.g., 01.02.03)\033[0m")
+    parts = parse_version(version)
+    if parts is None:
+        print(f"{RED}Error: Version must be in format XX.XX.XX (e.g., 01.02.03){RESET}")
         sys.exit(1)
     
-    git_root = get_git_root()
-    version_path = os.path.join(git_root, VERSION_FILE)
-    
-    with open(version_path, 'w') as f:
-        f.write(version)
-    
-    print(f"\033[92mVersion set to {version}\033[0m")
-    return version
+    return write_version(parts)
 
 def increment_version(current_version, major=False, minor=False, patch=False):
     """Increment the version based on which component should be increased."""
-    parts = current_version.split('.')
-    major_val = int(parts[0])
-    minor_val = int(parts[1])
-    patch_val = int(parts[2])
+    major_val, minor_val, patch_val = current_version
     
     # Store which components were incremented for adding stars later
     incremented = []
@@ -112,153 +262,254 @@ def increment_version(current_version, major=False, minor=False, patch=False):
         patch_val = (patch_val + 1) % 100
         incremented.append('patch')
     
-    # Format with leading zeros
-    new_version = f"{major_val:02d}.{minor_val:02d}.{patch_val:02d}"
-    
-    return new_version, incremented
+    return (major_val, minor_val, patch_val), incremented
 
 def format_version_with_stars(version, incremented):
     """Format the version with stars next to incremented components."""
     if not incremented:
-        return version  # No stars if nothing was incremented
+        return format_version(version)  # No stars if nothing was incremented
     
-    parts = version.split('.')
+    major, minor, patch = version
+    major_star = '*' if 'major' in incremented else ''
+    minor_star = '*' if 'minor' in incremented else ''
+    patch_star = '*' if 'patch' in incremented else ''
     
-    # Create the version string with stars
-    version_with_stars = ""
-    if 'major' in incremented:
-        version_with_stars += f"*{parts[0]}."
-    else:
-        version_with_stars += f"{parts[0]}."
-        
-    if 'minor' in incremented:
-        version_with_stars += f"*{parts[1]}."
-    else:
-        version_with_stars += f"{parts[1]}."
-        
-    if 'patch' in incremented:
-        version_with_stars += f"*{parts[2]}"
+    # Build the version string with stars in one go
+    return f"{major_star}{major:02d}.{minor_star}{minor:02d}.{patch_star}{patch:02d}"
+
+def parse_status_record(record):
+    """Parse one porcelain v2 record into a FileEntry.
+    
+    Returns None for record types that do not describe a change.
+    """
+    kind = record[:1]
+    if kind == b'1':
+        # Changed entry: "1 XY sub mH mI mW hH hI path"
+        fields = record.split(b' ', 8)
+        code, path = fields[1], fields[8]
+    elif kind == b'u':
+        # Unmerged entry: "u XY sub m1 m2 m3 mW h1 h2 h3 path"
+        fields = record.split(b' ', 10)
+        code, path = fields[1], fields[10]
+    elif kind == b'?':
+        # Untracked entry: "? path"
+        code, path = b'??', record[2:]
     else:
-        version_with_stars += f"{parts[2]}"
-    
-    return version_with_stars
+        # Ignored or unexpected record types
+        return None
+
+    # Keep the raw XY status (index, worktree); porcelain v2 marks an
+    # unchanged column with '.', which the short label code drops
+    status_code = code.decode()
+    status_text = _STATUS_TEXT.get(status_code.replace('.', ''), "Unknown")
+    return FileEntry(os.fsdecode(path), status_text, status_code)
 
 def get_changed_files():
-    """Get a list of files changed in the working directory."""
+    """Get a list of files changed in the working directory.
+    
+    The repository paths are resolved alongside: the rev-parse is started
+    first and runs while the status is streamed, instead of costing a
+    second git call back to back on the way in.
+    """
+    git_paths = start_git_paths()
+    
     # Get all changes (including untracked files)
-    status_output = run_command("git status --porcelain")
+    # Porcelain v2 with -z gives NUL-terminated records with fixed fields and
+    # unquoted paths; --no-renames reports a rename as a delete plus an add,
+    # so every record names exactly one path. A staged rename is therefore a
+    # "D." entry for the old path (already staged, so main() does not pass it
+    # to git add) and an "A." entry for the new one. Records are parsed as git emits them
+    command = ["git", "status", "--porcelain=v2", "-z", "--no-renames"]
+    try:
+        files = [entry for entry in map(parse_status_record, stream_records(command)) if entry]
+    except subprocess.CalledProcessError as e:
+        # Outside a repository this exits with the friendlier message
+        finish_git_paths(git_paths)
+        command_failed(command, f"exit status {e.returncode}")
+    finish_git_paths(git_paths)
     
-    if not status_output:
-        print("\033[93mNo changes to commit.\033[0m")
+    if not files:
+        print(f"{YELLOW}No changes to commit.{RESET}")
         sys.exit(0)
     
-    files = []
-    for line in status_output.split('\n'):
-        if line.strip():
-            # The first two characters are the status codes, but we must not strip them
-            # as that would remove leading spaces that are part of the format
-            status_code = line[:2].strip()
-            filename = line[2:].strip()
+    return files
 
-            if status_code == '??':
-                status_text = "\033[92mINSERT\033[0m"
-            
-            elif status_code == 'D':
-                status_text = "\033[91mDELETE\033[0m"
-            
-            elif status_code == 'M':
-                status_text = "\033[93mUPDATE\033[0m"
-                
-            else:
-                status_text = "Unknown"
+def get_file_status(path):
+    """Get the FileEntry for one path, or None if git does not list it (unchanged or ignored)."""
+    command = ["git", "--literal-pathspecs", "status", "--porcelain=v2", "-z",
+               "--no-renames", "--", path]
+    try:
+        entries = [entry for entry in map(parse_status_record, stream_records(command)) if entry]
+    except subprocess.CalledProcessError as e:
+        command_failed(command, f"exit status {e.returncode}")
+    return entries[0] if entries else None
 
-            files.append((filename, status_text, status_code))
-    
-    return files
+def usage_error(message):
+    """Print the usage line and an error, then exit with status 2."""
+    print(USAGE)
+    print(f"{RED}Error: {message}{RESET}")
+    sys.exit(2)
+
+def expand_short_flags(args):
+    """Split single-dash clusters like argparse: -Mm -> -M -m, -s01.02.03 -> -s 01.02.03."""
+    expanded = []
+    for arg in args:
+        if not arg.startswith('-') or arg.startswith('--') or len(arg) <= 2:
+            expanded.append(arg)
+            continue
+        for i, flag in enumerate(arg[1:], 2):
+            expanded.append('-' + flag)
+            if flag == 's':
+                # The rest of the cluster is the version, optionally after '='
+                value = arg[i:]
+                if value:
+                    expanded.append(value[1:] if value.startswith('=') else value)
+                break
+    return expanded
+
+def parse_args(args):
+    """Validate the command line and return the plan for this run.
+    
+    The plan is {"mode": "help"}, {"mode": "set", "version": "01.02.03"},
+    {"mode": "increment", "flags": (major, minor, patch)} or {"mode": "none"}.
+    Invalid input exits here, before anything touches the disk or runs git.
+    """
+    # sgit only takes a few fixed flags, so dispatch on the arguments directly
+    # instead of importing and building an argparse parser on every run
+    args = expand_short_flags(args)
+    
+    if '-h' in args or '--help' in args:
+        return {"mode": "help"}
+    
+    # Any mix of -M/-m/-p; each flag selects one component to increment.
+    # -s VERSION may appear anywhere and takes precedence, as it always has
+    major = minor = patch = False
+    version = None
+    remaining = iter(args)
+    for arg in remaining:
+        if arg == '-s':
+            version = next(remaining, None)
+            if version is None:
+                usage_error("-s takes a version (XX.XX.XX)")
+            continue
+        flags = _INCREMENT_FLAGS.get(arg)
+        if flags is None:
+            usage_error(f"unrecognized argument: {arg}")
+        major, minor, patch = major or flags[0], minor or flags[1], patch or flags[2]
+    
+    # Setting a specific version with sgit -s
+    if version is not None:
+        if not _VERSION_RE.fullmatch(version):
+            usage_error("Version must be in format XX.XX.XX (e.g., 01.02.03)")
+        return {"mode": "set", "version": version}
+    
+    if major or minor or patch:
+        return {"mode": "increment", "flags": (major, minor, patch)}
+    return {"mode": "none"}
 
 def main():
-    parser = argparse.ArgumentParser(description="Semantic Versioning Git Helper")
-    parser.add_argument('-M', action='store_true', help='Increment major version')
-    parser.add_argument('-m', action='store_true', help='Increment minor version')
-    parser.add_argument('-p', action='store_true', help='Increment patch version')
-    parser.add_argument('-s', metavar='VERSION', help='Set specific version (XX.XX.XX)')
+    plan = parse_args(sys.argv[1:])
     
-    args = parser.parse_args()
+    if plan["mode"] == "help":
+        print(__doc__.strip())
+        return
     
     # Handle setting specific version with sgit -s
-    if args.s:
-        set_version(args.s)
+    if plan["mode"] == "set":
+        set_version(plan["version"])
         return
     
+    # Get changed files first, so a run with nothing to commit exits before
+    # the version file is created or bumped
+    changed_files = get_changed_files()
+    
+    # Status paths are relative to the worktree root, so stage and commit
+    # from there even when sgit is run from a subdirectory
+    os.chdir(get_git_root())
+    
     # Get current version
+    version_existed = os.path.exists(get_version_path())
     current_version = get_current_version()
     
     # Handle version increments
     incremented = []
-    if args.M or args.m or args.p:
-        new_version, incremented = increment_version(current_version, args.M, args.m, args.p)
-        set_version(new_version)
+    if plan["mode"] == "increment":
+        new_version, incremented = increment_version(current_version, *plan["flags"])
+        write_version(new_version)
         current_version = new_version
     
-    # Get changed files
-    changed_files = get_changed_files()
-    
-    # Show files to be committed
-    print("\n\033[1mFiles to be committed:\033[0m")
-    for i, (filename, status_text, _) in enumerate(changed_files, 1):
-        print(f"{i}. {status_text} {filename}")
-    
-    # Ask if user wants to remove any files
-    print("\nEnter indices of files to exclude (comma-separated) or press Enter to include all:")
+    # The status was taken before the version file was written, so if this run
+    # created or bumped it, ask git about that one file again; git leaves it out
+    # when it is ignored, so it is never passed to git add in that case
+    if incremented or not version_existed:
+        version_entry = get_file_status(VERSION_FILE)
+        changed_files = [entry for entry in changed_files if entry.path != VERSION_FILE]
+        if version_entry:
+            changed_files.append(version_entry)
+    
+    # Show files to be committed and ask if user wants to remove any, as one
+    # block so the table costs a single write however many files there are
+    lines = [f"\n{BOLD}Files to be committed:{RESET}"]
+    lines.extend(f"{i}. {entry.status_text} {entry.path}"
+                 for i, entry in enumerate(changed_files, 1))
+    lines.append("\nEnter indices of files to exclude (comma-separated) or press Enter to include all:")
+    print("\n".join(lines))
     exclude_input = input("> ").strip()
     
-    # Create a list for files to add
-    files_to_add = []
-    
+    # Parse the indices to exclude (none if the user just pressed Enter)
+    exclude_indices = set()
     if exclude_input:
-        # Parse the indices to exclude
         try:
-            exclude_indices = [int(idx.strip()) for idx in exclude_input.split(',') if idx.strip().isdigit()]
-            # Only include files not in the exclude list
-            files_to_add = [file[0] for i, file in enumerate(changed_files, 1) if i not in exclude_indices]
+            exclude_indices = {int(idx.strip()) for idx in exclude_input.split(',') if idx.strip().isdigit()}
         except ValueError:
-            print("\033[93mInvalid input. Including all files.\033[0m")
-            files_to_add = [file[0] for file in changed_files]
-        
-        if not files_to_add:
-            print("\033[93mNo files selected for commit. Exiting.\033[0m")
-            sys.exit(0)
-    else:
-        # Include all files if no exclusion
-        files_to_add = [file[0] for file in changed_files]
+            print(f"{YELLOW}Invalid input. Including all files.{RESET}")
+    
+    # Split the changed files into those to add and those to leave out in one pass
+    files_to_add = []
+    files_to_stage = []
+    files_to_remove = []
+    files_to_unstage = []
+    for i, entry in enumerate(changed_files, 1):
+        if i in exclude_indices:
+            files_to_remove.append(entry.path)
+            # Only excluded files with staged changes (index column set) need unstaging
+            if entry.status_code[0] not in '.?':
+                files_to_unstage.append(entry.path)
+        else:
+            files_to_add.append(entry.path)
+            # A deletion already staged ("D.", e.g. from git rm or git mv) is gone
+            # from both the index and the worktree, so git add would reject it
+            if entry.status_code != "D.":
+                files_to_stage.append(entry.path)
+    
+    if not files_to_add:
+        print(f"{YELLOW}No files selected for commit. Exiting.{RESET}")
+        sys.exit(0)
     
     # Display the list of files that will be added
-    print("\n\033[1mFiles that will be added to commit:\033[0m")
-    for i, filename in enumerate(files_to_add, 1):
-        print(f"{i}. {filename}")
+    lines = [f"\n{BOLD}Files that will be added to commit:{RESET}"]
+    lines.extend(f"{i}. {filename}" for i, filename in enumerate(files_to_add, 1))
+    print("\n".join(lines))
     
     # Add files to staging
     if files_to_add:
-        # First reset any staged files
-        run_command("git reset", capture_output=False)
-        
-        # Use different approaches to handle file adding
         try:
-            # Method 1: Use git add . and then remove files we don't want
-            run_command("git add .", capture_output=False)
+            # Stage exactly the selected files, passing the paths as arguments
+            # (one git call unless the list is very long) so no quoting is needed.
+            # Paths are taken literally so names containing glob characters match
+            # only themselves; unstaged deletions are staged as removals too
+            run_with_paths(["git", "--literal-pathspecs", "add"], files_to_stage)
             
-            # If we're not adding all files, we need to remove some
-            all_files = [file[0] for file in changed_files]
-            files_to_remove = [file for file in all_files if file not in files_to_add]
+            if files_to_remove:
+                print("\n".join(f"{BLUE}Excluding: {file}{RESET}" for file in files_to_remove))
             
-            # Remove any files that should be excluded
-            for file in files_to_remove:
-                print(f"\033[94mExcluding: {file}\033[0m")
-                run_command(f"git reset HEAD \"{file}\"", capture_output=False)
+            # Unstage excluded files that were staged before sgit ran; the rest of
+            # the index is left untouched, and git is not run at all if none were
+            run_with_paths(["git", "--literal-pathspecs", "reset", "-q"], files_to_unstage)
                 
-            print(f"\n\033[92mAdded {len(files_to_add)} file(s) to commit\033[0m")
+            print(f"\n{GREEN}Added {len(files_to_add)} file(s) to commit{RESET}")
         except Exception as e:
-            print(f"\033[91mError adding files: {str(e)}\033[0m")
+            print(f"{RED}Error adding files: {str(e)}{RESET}")
             sys.exit(1)
     
     # Get commit message
@@ -267,7 +518,7 @@ def main():
     
     if not commit_message:
         # Use Unix timestamp as default message
-        commit_message = f"Automatic commit at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        commit_message = f"Automatic commit at {time.strftime('%Y-%m-%d %H:%M:%S')}"
     
     # Format version with stars for the commit
     version_display = format_version_with_stars(current_version, incremented)
@@ -276,13 +527,13 @@ def main():
     full_commit_message = f"[{version_display}] {commit_message}"
     
     # Commit and push
-    print(f"\n\033[94mCommitting with message: \"{full_commit_message}\"\033[0m")
-    run_command(f"git commit -m \"{full_commit_message}\"", capture_output=False)
+    print(f"\n{BLUE}Committing with message: \"{full_commit_message}\"{RESET}")
+    run_command(["git", "commit", "-m", full_commit_message], capture_output=False)
     
-    print("\n\033[94mPushing to remote repository...\033[0m")
-    push_result = run_command("git push", capture_output=True)
+    print(f"\n{BLUE}Pushing to remote repository...{RESET}")
+    run_command(["git", "push"], capture_output=True)
     
-    print(f"\n\033[92mSuccessfully pushed with version {current_version}\033[0m")
+    print(f"\n{GREEN}Successfully pushed with version {format_version(current_version)}{RESET}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file